@@ -33,26 +33,39 @@ Lessons learned from run_mteb_nomic_moe.py:
 """
 
 import argparse
+import contextlib
+import importlib.util
 import json
 import logging
 import os
 import signal
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-try:
-    import torch
-    import transformers
-    from mteb import evaluate, get_tasks
+if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
-except ImportError as e:
-    print(f"Error: Required package not installed: {e}")
+
+# Heavy packages (torch, transformers, mteb, sentence_transformers) are imported
+# lazily in run_mteb_benchmark(); only check they are installed here so the
+# "not installed" error and --help stay fast
+REQUIRED_PACKAGES = ("torch", "transformers", "mteb", "sentence_transformers")
+_missing_packages = [name for name in REQUIRED_PACKAGES if importlib.util.find_spec(name) is None]
+if _missing_packages:
+    print(f"Error: Required package not installed: {', '.join(_missing_packages)}")
     print("Install with: pip install mteb sentence-transformers torch transformers")
     sys.exit(1)
 
+# orjson is optional: it serializes large result payloads much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get script directory for output files (works when run from any location)
 SCRIPT_DIR = Path(__file__).parent.resolve()
 
@@ -65,20 +78,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Check transformers version requirement
 # modernbert-embed-base requires transformers>=4.48.0
 MIN_TRANSFORMERS_VERSION = (4, 48, 0)
-try:
-    current_version = tuple(map(int, transformers.__version__.split(".")[:3]))
-    if current_version < MIN_TRANSFORMERS_VERSION:
-        logger.warning(
-            f"⚠️  transformers version {transformers.__version__} may be too old. "
-            f"modernbert-embed-base requires >=4.48.0. "
-            f"Current: {transformers.__version__}, Required: >=4.48.0"
-        )
-        logger.warning("   Consider upgrading: pip install --upgrade transformers>=4.48.0")
-except Exception:
-    pass  # Version check failed, but continue
+
+
+def _lazy_import() -> tuple[Any, Any, Any]:
+    """
+    Import MTEB and sentence-transformers on first use.
+
+    Both pull in torch, transformers and datasets, which take seconds to import.
+
+    Returns:
+        Tuple of (evaluate, get_tasks, SentenceTransformer)
+    """
+    from mteb import evaluate, get_tasks
+    from sentence_transformers import SentenceTransformer
+
+    return evaluate, get_tasks, SentenceTransformer
+
+
+def check_transformers_version() -> None:
+    """Warn if the installed transformers is older than the model requires."""
+    try:
+        import transformers
+
+        current_version = tuple(map(int, transformers.__version__.split(".")[:3]))
+        if current_version < MIN_TRANSFORMERS_VERSION:
+            logger.warning(
+                f"⚠️  transformers version {transformers.__version__} may be too old. "
+                f"modernbert-embed-base requires >=4.48.0. "
+                f"Current: {transformers.__version__}, Required: >=4.48.0"
+            )
+            logger.warning("   Consider upgrading: pip install --upgrade transformers>=4.48.0")
+    except Exception:
+        pass  # Version check failed, but continue
 
 
 def configure_mps_for_large_tensors() -> None:
@@ -86,6 +119,8 @@ def configure_mps_for_large_tensors() -> None:
     Log MPS configuration (already set before torch import).
     This helps avoid 'Invalid buffer size' errors on macOS.
     """
+    import torch
+
     if torch.backends.mps.is_available():
         ratio = os.environ.get("PYTORCH_MPS_HIGH_WATERMARK_RATIO", "not set")
         fallback = os.environ.get("PYTORCH_ENABLE_MPS_FALLBACK", "not set")
@@ -99,6 +134,8 @@ def detect_device() -> str:
     Returns:
         Device string: 'mps', 'cuda', or 'cpu'
     """
+    import torch
+
     if torch.backends.mps.is_available():
         logger.info("✅ MPS (Metal Performance Shaders) available - using GPU acceleration")
         configure_mps_for_large_tensors()
@@ -111,6 +148,63 @@ def detect_device() -> str:
         return "cpu"
 
 
+def configure_cpu_threads() -> None:
+    """
+    Size PyTorch's CPU thread pools for inference.
+
+    Uses physical cores by default (hyperthreads contend with each other and with
+    the tokenizer pool). Override with the TORCH_NUM_THREADS environment variable.
+    Must run before torch does any parallel work.
+    """
+    # Must be set before tokenizers is imported to take effect
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+    import torch
+
+    num_threads: int | None = None
+    env_threads = os.environ.get("TORCH_NUM_THREADS")
+    if env_threads:
+        try:
+            num_threads = int(env_threads)
+        except ValueError:
+            logger.warning(f"⚠️  Invalid TORCH_NUM_THREADS={env_threads!r}, using default")
+    if num_threads is None:
+        try:
+            import psutil
+
+            num_threads = psutil.cpu_count(logical=False)
+        except ImportError:
+            pass
+    if not num_threads:
+        num_threads = os.cpu_count() or 1
+
+    torch.set_num_threads(max(1, num_threads))
+    # Raises if the inter-op pool has already started; keep torch's setting then
+    with contextlib.suppress(RuntimeError):
+        torch.set_num_interop_threads(1)
+    logger.info(f"Torch CPU threads: {torch.get_num_threads()}")
+
+
+@lru_cache(maxsize=2)
+def load_model(model_name: str, device: str, trust_remote_code: bool) -> "SentenceTransformer":
+    """
+    Load a SentenceTransformer model, reusing an already-loaded instance.
+
+    The CPU fallback path can trigger on many tasks in one run; caching keeps it
+    from re-reading the weights from disk every time.
+
+    Returns:
+        Loaded SentenceTransformer model
+    """
+    _, _, SentenceTransformer = _lazy_import()
+    model = SentenceTransformer(model_name, device=device, trust_remote_code=trust_remote_code)
+    # Evaluation only: make sure dropout is off and no parameter tracks gradients
+    model.eval()
+    for param in model.parameters():
+        param.requires_grad_(False)
+    return model
+
+
 def load_existing_results(output_file: Path) -> dict[str, Any] | None:
     """
     Load existing results file if it exists.
@@ -154,11 +248,102 @@ def get_completed_task_names(existing_results: dict[str, Any] | None) -> set[str
     return completed
 
 
+def get_task_name(task: Any, index: int) -> str:
+    """
+    Get a task's identifier - try multiple methods to get the actual task name.
+
+    Returns:
+        Task name, falling back to the class name or 'task_<index>'
+    """
+    task_name = None
+    if hasattr(task, "metadata") and task.metadata:
+        # Metadata is a Pydantic model, access name attribute directly
+        task_name = getattr(task.metadata, "name", None)
+    if not task_name and hasattr(task, "description"):
+        desc = task.description
+        if isinstance(desc, dict):
+            task_name = desc.get("name")
+    if not task_name:
+        # Use class name as fallback (e.g., "CQADupstackAndroidRetrieval")
+        task_name = task.__class__.__name__
+    if not task_name:
+        task_name = f"task_{index}"
+    return task_name
+
+
+def prefetch_task_data(task: Any) -> None:
+    """
+    Load a task's dataset ahead of its evaluation.
+
+    Runs in a background thread; evaluate() skips loading for tasks whose data
+    is already loaded. Dataset downloads and tokenization release the GIL, so
+    this overlaps with encoding of the current task.
+    """
+    task.load_data()
+
+
+def release_prefetched_data(task: Any, pending_load: Future[None]) -> None:
+    """
+    Unload a prefetched task's data once its prefetch has finished.
+
+    evaluate() only unloads data it loaded itself, so without this every
+    prefetched corpus would stay in memory for the rest of the run. The callback
+    runs immediately if the prefetch is done, otherwise in the prefetch thread
+    when it finishes (e.g. after a timeout interrupted the wait), so it never
+    races a load still in progress.
+    """
+
+    def unload(_: Future[None]) -> None:
+        with contextlib.suppress(Exception):
+            task.unload_data()
+
+    pending_load.add_done_callback(unload)
+
+
+def should_prefetch_task(task: Any, model: "SentenceTransformer") -> bool:
+    """
+    Check whether evaluate() will actually load a task's data.
+
+    evaluate(..., overwrite_strategy="only-missing") skips tasks whose splits are
+    all in MTEB's result cache without loading their data, so prefetching those
+    would only add downloads. If the cache lookup fails, don't prefetch;
+    evaluate() still loads the data itself when needed. That includes mteb
+    releases that don't export ResultCache at the top level (before ~2.10).
+    """
+    try:
+        from mteb import ResultCache, SentenceTransformerEncoderWrapper
+
+        # Same cache location and model metadata evaluate() uses for its lookup
+        meta = SentenceTransformerEncoderWrapper(model).mteb_model_meta
+        cached = ResultCache().load_task_result(task.metadata.name, meta)
+        return cached is None or bool(cached.get_missing_evaluations(task))
+    except TimeoutError:
+        # Raised by the per-task SIGALRM handler; must reach the task loop
+        raise
+    except Exception as e:
+        logger.debug(f"Skipping prefetch, MTEB cache lookup failed: {e}")
+        return False
+
+
 def save_results_incremental(output_file: Path, summary: dict[str, Any]) -> None:
     """Save results incrementally after each task."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, default=str)
+    if orjson is not None:
+        # OPT_SERIALIZE_NUMPY handles numpy scalars/arrays returned by MTEB natively;
+        # default=str still covers MTEB result objects, same as the json fallback
+        payload = orjson.dumps(
+            summary,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    else:
+        payload = json.dumps(summary, indent=2, default=str).encode("utf-8")
+
+    # Serialize fully, then write once to a temp file and swap it in, so a crash
+    # or a concurrent reader (e.g. --resume) never sees a partially written file
+    tmp_file = output_file.with_name(output_file.name + ".tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, output_file)
 
 
 def run_mteb_benchmark(  # noqa: C901
@@ -208,6 +393,12 @@ def run_mteb_benchmark(  # noqa: C901
     logger.info(f"Start time: {datetime.now().isoformat()}")
     logger.info("")
 
+    # Import the heavy dependencies only once there is work to do
+    import torch
+
+    evaluate, get_tasks, _ = _lazy_import()
+    check_transformers_version()
+
     # Detect device if not specified
     if device is None:
         device = detect_device()
@@ -230,7 +421,7 @@ def run_mteb_benchmark(  # noqa: C901
     logger.info("   MTEB should handle this automatically via model metadata.")
     logger.info("")
     try:
-        model = SentenceTransformer(model_name, device=device, trust_remote_code=trust_remote_code)
+        model = load_model(model_name, device, trust_remote_code)
         logger.info("✅ Model loaded successfully")
         logger.info(f"   Max sequence length: {model.max_seq_length}")
         logger.info(f"   Embedding dimension: {model.get_sentence_embedding_dimension()}")
@@ -323,6 +514,10 @@ def run_mteb_benchmark(  # noqa: C901
     def timeout_handler(signum, frame):
         raise TimeoutError("Task timeout exceeded")
 
+    # Loads the next task's data while the current task is evaluated
+    prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mteb-prefetch")
+    prefetched: dict[int, Future[None]] = {}
+
     try:
         # Run each task with progress tracking
         skipped_count = 0
@@ -337,20 +532,7 @@ def run_mteb_benchmark(  # noqa: C901
                     )
                     break
 
-            # Get task name - try multiple methods to get the actual task identifier
-            task_name = None
-            if hasattr(task, "metadata") and task.metadata:
-                # Metadata is a Pydantic model, access name attribute directly
-                task_name = getattr(task.metadata, "name", None)
-            if not task_name and hasattr(task, "description"):
-                desc = task.description
-                if isinstance(desc, dict):
-                    task_name = desc.get("name")
-            if not task_name:
-                # Use class name as fallback (e.g., "CQADupstackAndroidRetrieval")
-                task_name = task.__class__.__name__
-            if not task_name:
-                task_name = f"task_{i}"
+            task_name = get_task_name(task, i)
 
             # Skip if already completed (when resuming)
             if resume and task_name in completed_task_names:
@@ -368,6 +550,7 @@ def run_mteb_benchmark(  # noqa: C901
             logger.info(f"[{i}/{len(available_tasks)}] Starting: {task_name}")
             logger.info(f"  Start time: {datetime.now().isoformat()}")
 
+            pending_load: Future[None] | None = None
             try:
                 # Set up timeout signal if specified (Unix/macOS only)
                 if task_timeout_seconds:
@@ -380,6 +563,22 @@ def run_mteb_benchmark(  # noqa: C901
                             "(Windows doesn't support SIGALRM)"
                         )
 
+                # Wait for this task's prefetched data (if any) before evaluate() reads it.
+                # exception() returns a failed prefetch's error instead of raising it, so
+                # only the per-task alarm's TimeoutError can escape this wait. A failed
+                # prefetch is ignored: evaluate() loads the data itself and reports the error.
+                pending_load = prefetched.pop(i, None)
+                if pending_load is not None:
+                    pending_load.exception()
+
+                # Start loading the next task that will actually run and isn't cached
+                if i < len(available_tasks):
+                    next_task = available_tasks[i]
+                    if not (
+                        resume and get_task_name(next_task, i + 1) in completed_task_names
+                    ) and should_prefetch_task(next_task, model):
+                        prefetched[i + 1] = prefetch_executor.submit(prefetch_task_data, next_task)
+
                 # Run evaluation with progress bar
                 # Configure encode_kwargs for MPS compatibility
                 encode_kwargs = None
@@ -391,13 +590,16 @@ def run_mteb_benchmark(  # noqa: C901
                 # Use "only-missing" overwrite strategy to leverage MTEB cache
                 # This allows resuming without re-running completed tasks
                 try:
-                    result = evaluate(
-                        model=model,
-                        tasks=task,
-                        show_progress_bar=True,
-                        encode_kwargs=encode_kwargs,
-                        overwrite_strategy="only-missing",  # Skip if already in cache
-                    )
+                    # Inference only: skip autograd bookkeeping (stronger than no_grad).
+                    # Scoped to evaluate() so models loaded here aren't inference tensors
+                    with torch.inference_mode():
+                        result = evaluate(
+                            model=model,
+                            tasks=task,
+                            show_progress_bar=True,
+                            encode_kwargs=encode_kwargs,
+                            overwrite_strategy="only-missing",  # Skip if already in cache
+                        )
                 except (RuntimeError, ValueError) as e:
                     error_msg = str(e)
                     if (
@@ -408,15 +610,13 @@ def run_mteb_benchmark(  # noqa: C901
                         logger.warning(f"⚠️  MPS error detected: {error_msg[:150]}...")
                         logger.warning("   Falling back to CPU for this task...")
                         cpu_fallback_count += 1
-                        # Reload model on CPU with larger batch size (CPU can handle it)
-                        model_cpu = SentenceTransformer(
-                            model_name,
-                            device="cpu",
-                            trust_remote_code=trust_remote_code,
-                        )
+                        # Load model on CPU with larger batch size (CPU can handle it)
+                        # Cached after the first fallback, so later tasks reuse it
+                        model_cpu = load_model(model_name, "cpu", trust_remote_code)
                         # CPU can handle larger batches, use default batch_size=32
                         # (MTEB will use this if not overridden)
-                        result = evaluate(model=model_cpu, tasks=task, show_progress_bar=True)
+                        with torch.inference_mode():
+                            result = evaluate(model=model_cpu, tasks=task, show_progress_bar=True)
                         logger.info("✅ Task completed on CPU (fallback)")
                     else:
                         raise  # Re-raise if it's not an MPS buffer issue
@@ -520,6 +720,10 @@ def run_mteb_benchmark(  # noqa: C901
                     "results": task_results,
                 }
                 save_results_incremental(output_file, temp_summary)
+            finally:
+                # Free this task's prefetched data whether it completed, failed or timed out
+                if pending_load is not None:
+                    release_prefetched_data(task, pending_load)
 
         total_duration = time.time() - start_time
 
@@ -607,6 +811,12 @@ def run_mteb_benchmark(  # noqa: C901
         }
         save_results_incremental(output_file, partial_summary)
         return partial_summary
+    finally:
+        # Don't wait for a prefetch whose task will never run (e.g. total timeout hit),
+        # but free its data if the load already finished or is still running
+        prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        for next_index, pending in prefetched.items():
+            release_prefetched_data(available_tasks[next_index - 1], pending)
 
     # Save final results (already saved incrementally, but save final version)
     save_results_incremental(output_file, summary)
@@ -733,42 +943,46 @@ Examples:
 
     model_name = "nomic-ai/modernbert-embed-base"
 
-    logger.info("=" * 80)
-    logger.info("MTEB Benchmark for nomic-ai/modernbert-embed-base")
-    logger.info("=" * 80)
-    logger.info("")
-    logger.info(f"Mode: {mode}")
+    # Emit the banner as a single log record instead of one record per line
+    lines = [
+        "=" * 80,
+        "MTEB Benchmark for nomic-ai/modernbert-embed-base",
+        "=" * 80,
+        "",
+        f"Mode: {mode}",
+    ]
     if limit_tasks:
-        logger.info(f"  - Limiting to {limit_tasks} tasks")
+        lines.append(f"  - Limiting to {limit_tasks} tasks")
     else:
-        logger.info("  - Running all tasks")
+        lines.append("  - Running all tasks")
     if task_timeout_seconds:
-        logger.info(f"  - Task timeout: {task_timeout_seconds}s")
+        lines.append(f"  - Task timeout: {task_timeout_seconds}s")
     if total_timeout_seconds:
-        logger.info(f"  - Total timeout: {total_timeout_seconds}s")
-    logger.info(f"  - Task types: {args.task_types}")
-    logger.info(f"  - Device: {device or 'auto-detect'}")
-    logger.info("")
-    logger.info("This will run MTEB retrieval tasks to get benchmark scores.")
-    logger.info("Note: Full MTEB can take hours. Progress will be logged to:")
-    logger.info("  - Console (stdout)")
-    logger.info(f"  - Log file: {log_file}")
-    logger.info("")
-    logger.info("Model Requirements (from model card):")
-    logger.info("  - transformers>=4.48.0 (checking version...)")
-    logger.info(
-        "  - Prefixes required: 'search_query: ' for queries, 'search_document: ' for documents"
-    )
-    logger.info("  - MTEB should handle prefixes automatically via model metadata")
-    logger.info("")
-    logger.info("Hardware acceleration:")
-    logger.info("  - macOS: MPS (Metal Performance Shaders) will be used if available")
-    logger.info("  - CUDA: Will be used if available (Linux/Windows)")
-    logger.info("  - Flash Attention: Not available on macOS (CUDA-only)")
-    logger.info(
-        "  - Note: ModernBERT-base supports efficient inference with unpadding and Flash Attention"
-    )
-    logger.info("")
+        lines.append(f"  - Total timeout: {total_timeout_seconds}s")
+    lines += [
+        f"  - Task types: {args.task_types}",
+        f"  - Device: {device or 'auto-detect'}",
+        "",
+        "This will run MTEB retrieval tasks to get benchmark scores.",
+        "Note: Full MTEB can take hours. Progress will be logged to:",
+        "  - Console (stdout)",
+        f"  - Log file: {log_file}",
+        "",
+        "Model Requirements (from model card):",
+        "  - transformers>=4.48.0 (checking version...)",
+        "  - Prefixes required: 'search_query: ' for queries, 'search_document: ' for documents",
+        "  - MTEB should handle prefixes automatically via model metadata",
+        "",
+        "Hardware acceleration:",
+        "  - macOS: MPS (Metal Performance Shaders) will be used if available",
+        "  - CUDA: Will be used if available (Linux/Windows)",
+        "  - Flash Attention: Not available on macOS (CUDA-only)",
+        "  - Note: ModernBERT-base supports efficient inference with unpadding and Flash Attention",
+        "",
+    ]
+    logger.info("\n".join(lines))
+
+    configure_cpu_threads()
 
     # Run benchmark
     results = run_mteb_benchmark(
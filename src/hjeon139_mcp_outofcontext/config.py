@@ -5,15 +5,27 @@ import logging
 import os
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Use orjson for config parsing when it is installed; it is an optional speedup
+try:
+    import orjson
 
-@dataclass
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration for MCP server."""
+    """Configuration for MCP server.
+
+    Frozen because load_config() returns a cached, shared instance.
+    """
 
     storage_path: str = "out_of_context"
     log_level: str = "INFO"
@@ -27,7 +39,12 @@ class Config:
 
 
 Converter = Callable[[str], Any]
-EnvMapping = dict[str, str | tuple[str, Converter]]
+
+# (environment variable, config key, converter); None means use the raw string
+_ENV_MAPPINGS: tuple[tuple[str, str, Converter | None], ...] = (
+    ("OUT_OF_CONTEXT_STORAGE_PATH", "storage_path", None),
+    ("OUT_OF_CONTEXT_LOG_LEVEL", "log_level", None),
+)
 
 
 def migrate_old_storage_directory() -> None:
@@ -75,7 +92,32 @@ def migrate_old_storage_directory() -> None:
         migration_marker.touch()
 
 
-def load_config() -> Config:  # noqa: C901
+def _read_config_file(config_file: Path) -> dict[str, Any] | None:
+    """Read a JSON config file.
+
+    Opens the file directly instead of checking exists() first, so a missing
+    file costs a single failed open() rather than a stat followed by an open.
+
+    Args:
+        config_file: Path to the config file
+
+    Returns:
+        Parsed config dict, or None if the file does not exist
+
+    Raises:
+        OSError: If the file exists but cannot be read
+        ValueError: If the file is not valid JSON (json and orjson decode errors
+            both subclass ValueError)
+    """
+    try:
+        with open(config_file, "rb") as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Config:
     """Load configuration from environment variables, config file, and defaults.
 
     Priority:
@@ -83,6 +125,9 @@ def load_config() -> Config:  # noqa: C901
     2. Config file (out_of_context/config.json or ~/out_of_context/config.json)
     3. Default values (lowest priority)
 
+    The result is cached for the lifetime of the process; call
+    load_config.cache_clear() to pick up changed files or environment variables.
+
     Returns:
         Config instance with loaded values
     """
@@ -91,64 +136,46 @@ def load_config() -> Config:  # noqa: C901
 
     # Load from config file if it exists (check project directory first, then home)
     config_file = Path("out_of_context") / "config.json"
-    if not config_file.exists():
-        config_file = Path.home() / "out_of_context" / "config.json"
-    if config_file.exists():
-        try:
-            with open(config_file) as f:
-                file_config = json.load(f)
-                config_dict.update(file_config)
-        except (OSError, json.JSONDecodeError) as e:
-            # Log warning but continue with defaults/env vars
-            logger.warning(f"Could not load config file {config_file}: {e}")
+    try:
+        file_config = _read_config_file(config_file)
+        if file_config is None:
+            config_file = Path.home() / "out_of_context" / "config.json"
+            file_config = _read_config_file(config_file)
+        if file_config is not None:
+            config_dict.update(file_config)
+    except (OSError, ValueError) as e:
+        # Log warning but continue with defaults/env vars
+        logger.warning(f"Could not load config file {config_file}: {e}")
 
     # Override with environment variables (highest priority)
-    env_mappings: EnvMapping = {
-        "OUT_OF_CONTEXT_STORAGE_PATH": "storage_path",
-        "OUT_OF_CONTEXT_LOG_LEVEL": "log_level",
-    }
-
-    for env_var, mapping in env_mappings.items():
+    for env_var, key, converter in _ENV_MAPPINGS:
         value = os.getenv(env_var)
-        if value is not None:
-            if isinstance(mapping, tuple):
-                key, converter = mapping
-                try:
-                    config_dict[key] = converter(value)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid value for {env_var}: {value}")
-            else:
-                config_dict[mapping] = value
+        if value is None:
+            continue
+        if converter is None:
+            config_dict[key] = value
+            continue
+        try:
+            config_dict[key] = converter(value)
+        except (ValueError, TypeError):
+            logger.warning(f"Invalid value for {env_var}: {value}")
 
     # Expand ~ in storage_path
     if "storage_path" in config_dict:
         config_dict["storage_path"] = os.path.expanduser(config_dict["storage_path"])
 
     # Warn if using old hidden directory path
+    # Compare the last path component as a string (handles / and \ separators and
+    # trailing slashes); resolving the path would cost a syscall for a name check
     storage_path = config_dict.get("storage_path", "out_of_context")
-    # Use Path to handle all path formats (relative, absolute, Windows, Unix)
-    try:
-        storage_path_obj = Path(storage_path).resolve()
-        if storage_path_obj.name == ".out_of_context":
-            logger.warning(
-                "⚠️  WARNING: You are using the old hidden directory path '.out_of_context'.\n"
-                "   This may cause permission issues when agents try to edit context files.\n"
-                "   Please update your configuration to use 'out_of_context' instead.\n"
-                "   See CHANGELOG.md for migration instructions."
-            )
-    except (OSError, ValueError):
-        # Path resolution failed, fall back to string comparison
-        if (
-            storage_path == ".out_of_context"
-            or storage_path.endswith("/.out_of_context")
-            or storage_path.endswith("\\.out_of_context")
-        ):
-            logger.warning(
-                "⚠️  WARNING: You are using the old hidden directory path '.out_of_context'.\n"
-                "   This may cause permission issues when agents try to edit context files.\n"
-                "   Please update your configuration to use 'out_of_context' instead.\n"
-                "   See CHANGELOG.md for migration instructions."
-            )
+    base_name = storage_path.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+    if base_name == ".out_of_context":
+        logger.warning(
+            "⚠️  WARNING: You are using the old hidden directory path '.out_of_context'.\n"
+            "   This may cause permission issues when agents try to edit context files.\n"
+            "   Please update your configuration to use 'out_of_context' instead.\n"
+            "   See CHANGELOG.md for migration instructions."
+        )
 
     # Create Config instance with defaults and overrides
     return Config(**config_dict)
@@ -43,6 +43,8 @@ def initialize_app_state(config: Config | None = None) -> None:
     if config is None:
         config = load_config()
     _app_state = AppState(config=config.to_dict())
+    # The registered middleware is created at import time, before AppState exists
+    _app_state_middleware.app_state = _app_state
 
 
 class AppStateMiddleware(Middleware):
@@ -50,30 +52,37 @@ class AppStateMiddleware(Middleware):
 
     This ensures AppState is available in tools via ctx.get_state("app_state").
     Follows FastMCP best practices for dependency injection.
+
+    The AppState is held on the instance so requests don't look up the module
+    global; initialize_app_state() rebinds it on the registered middleware.
     """
 
-    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
-        """Inject AppState into context state before tool execution."""
-        if _app_state is None:
-            raise RuntimeError("AppState not initialized")
-        if context.fastmcp_context is None:
-            raise RuntimeError("FastMCP context not available")
-        context.fastmcp_context.set_state("app_state", _app_state)
-        return await call_next(context)
+    def __init__(self, app_state: AppState | None = None) -> None:
+        """Initialize middleware.
+
+        Args:
+            app_state: AppState to inject. Defaults to the current module-level AppState.
+        """
+        self.app_state = app_state if app_state is not None else _app_state
 
-    # Optionally handle resources and prompts similarly
-    async def on_read_resource(self, context: MiddlewareContext, call_next: Any) -> Any:
-        """Inject AppState for resource access."""
-        if _app_state is None:
+    async def _inject_app_state(self, context: MiddlewareContext, call_next: Any) -> Any:
+        """Inject AppState into context state before the request is handled."""
+        app_state = self.app_state
+        if app_state is None:
             raise RuntimeError("AppState not initialized")
         if context.fastmcp_context is None:
             raise RuntimeError("FastMCP context not available")
-        context.fastmcp_context.set_state("app_state", _app_state)
+        context.fastmcp_context.set_state("app_state", app_state)
         return await call_next(context)
 
+    # Tools and resources share one hook; add other hooks (e.g. prompts) the same way
+    on_call_tool = _inject_app_state
+    on_read_resource = _inject_app_state
+
 
 # Add middleware to inject AppState
-mcp.add_middleware(AppStateMiddleware())
+_app_state_middleware = AppStateMiddleware()
+mcp.add_middleware(_app_state_middleware)
 
 
 # Import and register tools (must be after mcp instance is created)
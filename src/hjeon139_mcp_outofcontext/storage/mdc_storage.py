@@ -1,10 +1,15 @@
 """MDC storage layer for markdown files with YAML frontmatter."""
 
+import copy
+import heapq
 import json
 import logging
 import os
 import re
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +17,12 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Filename-safe context names: alphanumeric, hyphens, underscores only
+_NAME_PATTERN = re.compile(r"[a-zA-Z0-9_-]+")
+
+# Maximum number of parsed .mdc files kept in memory per storage instance
+DEFAULT_CACHE_SIZE = 1024
+
 
 def _validate_name(name: str) -> None:
     """Validate that name is filename-safe.
@@ -24,21 +35,34 @@ def _validate_name(name: str) -> None:
     """
     if not name:
         raise ValueError("Name cannot be empty")
-    # Filename-safe: alphanumeric, hyphens, underscores only
-    if not re.match(r"^[a-zA-Z0-9_-]+$", name):
+    # fullmatch, unlike "$", does not accept a trailing newline
+    if not _NAME_PATTERN.fullmatch(name):
         raise ValueError(
             f"Name '{name}' must contain only alphanumeric characters, hyphens, and underscores"
         )
 
 
+@dataclass(slots=True)
+class _CachedFile:
+    """Parsed .mdc file plus lazily built lowercase search text."""
+
+    signature: tuple[int, int]
+    data: dict[str, Any]
+    text_lower: str | None = None
+    metadata_lower: tuple[str, ...] = ()
+
+
 class MDCStorage:
     """Storage layer for markdown files with YAML frontmatter."""
 
-    def __init__(self, storage_path: str | None = None) -> None:
+    def __init__(
+        self, storage_path: str | None = None, cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
         """Initialize MDC storage.
 
         Args:
             storage_path: Path to storage directory. Defaults to out_of_context/contexts/ in project root
+            cache_size: Maximum number of parsed files to keep in memory (0 disables caching)
         """
         if storage_path is None:
             default_path = Path("out_of_context") / "contexts"
@@ -55,6 +79,12 @@ class MDCStorage:
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+        # Parsed .mdc files keyed by path, validated against (st_mtime_ns, st_size)
+        # so files edited outside this process are re-read on next access
+        # Least recently used entries are evicted once cache_size is exceeded
+        self._cache_size = cache_size
+        self._parsed_cache: OrderedDict[Path, _CachedFile] = OrderedDict()
+
     def save_context(self, name: str, text: str, metadata: dict[str, Any] | None = None) -> None:
         """Save a single context as .mdc file.
 
@@ -107,6 +137,8 @@ class MDCStorage:
 
         # Write file with YAML frontmatter + markdown body
         self._write_mdc_file(file_path, meta, text)
+        # Drop any cached parse; mtime granularity may not catch a fast rewrite
+        self._parsed_cache.pop(file_path, None)
 
     def save_contexts(self, contexts: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Save multiple contexts (bulk operation).
@@ -148,15 +180,19 @@ class MDCStorage:
         _validate_name(name)
         file_path = self.storage_path / f"{name}.mdc"
 
-        if not file_path.exists():
-            return None
-
         try:
-            return self._read_mdc_file(file_path)
+            data = self._read_mdc_file_cached(file_path)
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to load context '{name}': {e}")
             return None
 
+        if data is None:
+            return None
+        # Copy metadata so callers cannot mutate the cached parse
+        return {"metadata": copy.deepcopy(data["metadata"]), "text": data["text"]}
+
     def load_contexts(self, names: list[str]) -> list[dict[str, Any] | None]:
         """Load multiple contexts (bulk operation).
 
@@ -177,9 +213,12 @@ class MDCStorage:
 
         return results
 
-    def list_contexts(self) -> list[dict[str, Any]]:
+    def list_contexts(self, limit: int | None = None) -> list[dict[str, Any]]:
         """List all contexts.
 
+        Args:
+            limit: Optional maximum number of contexts to return (newest first)
+
         Returns:
             List of dicts with 'name', 'created_at', 'preview' (first 100 chars)
         """
@@ -188,7 +227,7 @@ class MDCStorage:
         for file_path in self.storage_path.glob("*.mdc"):
             name = file_path.stem
             try:
-                data = self._read_mdc_file(file_path)
+                data = self._read_mdc_file_cached(file_path)
                 if data:
                     metadata = data.get("metadata", {})
                     text = data.get("text", "")
@@ -211,12 +250,13 @@ class MDCStorage:
             except Exception as e:
                 logger.warning(f"Failed to read context file '{file_path}': {e}")
 
-        # Sort by created_at (newest first)
-        # Normalize all created_at values to strings for consistent sorting
-        contexts.sort(
-            key=lambda x: x.get("created_at", "") or "", reverse=True
-        )  # Empty string sorts last
+        # Sort by created_at (newest first); values were normalized to strings
+        # above, so empty strings sort last
+        if limit is not None and 0 < limit < len(contexts):
+            # Top-k selection; same result as sorting and slicing
+            return heapq.nlargest(limit, contexts, key=itemgetter("created_at"))
 
+        contexts.sort(key=itemgetter("created_at"), reverse=True)
         return contexts
 
     def delete_context(self, name: str) -> None:
@@ -231,14 +271,15 @@ class MDCStorage:
         _validate_name(name)
         file_path = self.storage_path / f"{name}.mdc"
 
-        if not file_path.exists():
-            raise ValueError(f"Context '{name}' not found")
-
         try:
             file_path.unlink()
+        except FileNotFoundError:
+            raise ValueError(f"Context '{name}' not found") from None
         except Exception as e:
             logger.error(f"Failed to delete context '{name}': {e}")
             raise
+        finally:
+            self._parsed_cache.pop(file_path, None)
 
     def delete_contexts(self, names: list[str]) -> list[dict[str, Any]]:
         """Delete multiple contexts (bulk operation).
@@ -260,11 +301,12 @@ class MDCStorage:
 
         return results
 
-    def search_contexts(self, query: str) -> list[dict[str, Any]]:
+    def search_contexts(self, query: str, limit: int | None = None) -> list[dict[str, Any]]:
         """Search contexts by query string.
 
         Args:
             query: Search query (searches in both frontmatter and markdown body)
+            limit: Optional maximum number of matches; scanning stops once reached
 
         Returns:
             List of matching contexts with 'name', 'text', 'metadata', 'matches' (where query was found)
@@ -277,19 +319,25 @@ class MDCStorage:
 
         for file_path in self.storage_path.glob("*.mdc"):
             try:
-                data = self._read_mdc_file(file_path)
-                if not data:
+                entry = self._get_cached_file(file_path)
+                if entry is None or not entry.data:
                     continue
 
                 name = file_path.stem
-                text = data.get("text", "")
-                metadata = data.get("metadata", {})
+                text = entry.data.get("text", "")
+                metadata = entry.data.get("metadata", {})
+
+                # Lowercase once per file version, not once per search. Assign only
+                # after both succeed so a failing file is skipped on every search
+                if entry.text_lower is None:
+                    text_lower = text.lower()
+                    metadata_lower = tuple(str(v).lower() for v in metadata.values() if v)
+                    entry.text_lower = text_lower
+                    entry.metadata_lower = metadata_lower
 
                 # Search in text and metadata
-                found_in_text = query_lower in text.lower()
-                found_in_metadata = any(
-                    query_lower in str(v).lower() for v in metadata.values() if v
-                )
+                found_in_text = query_lower in entry.text_lower
+                found_in_metadata = any(query_lower in v for v in entry.metadata_lower)
 
                 if found_in_text or found_in_metadata:
                     match_locations = []
@@ -302,10 +350,12 @@ class MDCStorage:
                         {
                             "name": name,
                             "text": text,
-                            "metadata": metadata,
+                            "metadata": copy.deepcopy(metadata),
                             "matches": match_locations,
                         }
                     )
+                    if limit is not None and 0 < limit <= len(matches):
+                        break
             except Exception as e:
                 logger.warning(f"Failed to search context file '{file_path}': {e}")
 
@@ -323,12 +373,60 @@ class MDCStorage:
         frontmatter = yaml.dump(metadata, default_flow_style=False, sort_keys=False)
         frontmatter = frontmatter.strip()
 
-        # Write file: frontmatter + separator + markdown body
+        # Write file in one call: frontmatter + separator + markdown body
+        content = f"---\n{frontmatter}\n---\n\n{text}"
         with open(file_path, "w", encoding="utf-8") as f:
-            f.write("---\n")
-            f.write(frontmatter)
-            f.write("\n---\n\n")
-            f.write(text)
+            f.write(content)
+
+    def _read_mdc_file_cached(self, file_path: Path) -> dict[str, Any] | None:
+        """Read .mdc file, reusing the cached parse while the file is unchanged.
+
+        The returned dict is shared with the cache and must not be mutated.
+
+        Args:
+            file_path: Path to read file
+
+        Returns:
+            Dict with 'metadata' and 'text', or None on error
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        entry = self._get_cached_file(file_path)
+        return entry.data if entry is not None else None
+
+    def _get_cached_file(self, file_path: Path) -> _CachedFile | None:
+        """Return the cache entry for a file, re-parsing it if it changed on disk.
+
+        Args:
+            file_path: Path to read file
+
+        Returns:
+            Cache entry, or None if the file could not be read
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        stat = file_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._parsed_cache.get(file_path)
+        if entry is not None and entry.signature == signature:
+            self._parsed_cache.move_to_end(file_path)
+            return entry
+
+        data = self._read_mdc_file(file_path)
+        if data is None:
+            self._parsed_cache.pop(file_path, None)
+            return None
+
+        entry = _CachedFile(signature=signature, data=data)
+        if self._cache_size > 0:
+            self._parsed_cache[file_path] = entry
+            self._parsed_cache.move_to_end(file_path)
+            while len(self._parsed_cache) > self._cache_size:
+                self._parsed_cache.popitem(last=False)
+        return entry
 
     def _read_mdc_file(self, file_path: Path) -> dict[str, Any] | None:
         """Read .mdc file and parse YAML frontmatter + markdown body.
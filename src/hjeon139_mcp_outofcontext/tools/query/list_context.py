@@ -34,11 +34,7 @@ async def list_context(
 
     try:
         storage = app_state.storage
-        contexts = storage.list_contexts()
-
-        # Apply limit if provided
-        if limit is not None and limit > 0:
-            contexts = contexts[:limit]
+        contexts = storage.list_contexts(limit)
 
         return {
             "success": True,
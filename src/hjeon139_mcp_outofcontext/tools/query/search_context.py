@@ -44,11 +44,7 @@ async def search_context(
             }
 
         storage = app_state.storage
-        matches = storage.search_contexts(query)
-
-        # Apply limit if provided
-        if limit is not None and limit > 0:
-            matches = matches[:limit]
+        matches = storage.search_contexts(query, limit)
 
         return {
             "success": True,
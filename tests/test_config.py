@@ -10,6 +10,12 @@ import pytest
 from hjeon139_mcp_outofcontext.config import Config, load_config
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache() -> None:
+    """Reset the load_config() cache so each test sees its own environment."""
+    load_config.cache_clear()
+
+
 @pytest.mark.unit
 class TestConfig:
     """Test Config dataclass."""
@@ -157,6 +163,70 @@ class TestLoadConfig:
                 elif "OUT_OF_CONTEXT_LOG_LEVEL" in os.environ:
                     del os.environ["OUT_OF_CONTEXT_LOG_LEVEL"]
 
+    def test_load_config_project_file_takes_precedence(self, tmp_path) -> None:
+        """Test project out_of_context/config.json wins over the home config."""
+        home_dir = tmp_path / "home"
+        (home_dir / "out_of_context").mkdir(parents=True)
+        (home_dir / "out_of_context" / "config.json").write_text('{"log_level": "ERROR"}')
+        project_dir = tmp_path / "project"
+        (project_dir / "out_of_context").mkdir(parents=True)
+        (project_dir / "out_of_context" / "config.json").write_text('{"log_level": "DEBUG"}')
+
+        original_home = os.environ.get("HOME")
+        original_log_level = os.environ.pop("OUT_OF_CONTEXT_LOG_LEVEL", None)
+        original_cwd = os.getcwd()
+
+        try:
+            os.environ["HOME"] = str(home_dir)
+            os.chdir(project_dir)
+
+            config = load_config()
+            assert config.log_level == "DEBUG"
+        finally:
+            if original_home:
+                os.environ["HOME"] = original_home
+            if original_log_level:
+                os.environ["OUT_OF_CONTEXT_LOG_LEVEL"] = original_log_level
+            os.chdir(original_cwd)
+
+    @pytest.mark.parametrize(
+        ("storage_path", "warns"),
+        [
+            (".out_of_context", True),
+            ("/home/user/project/.out_of_context/", True),
+            ("C:\\Users\\user\\.out_of_context", True),
+            ("out_of_context", False),
+            ("/home/user/.out_of_context_backup", False),
+        ],
+    )
+    def test_load_config_warns_on_old_hidden_directory(
+        self, storage_path: str, warns: bool, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test the old hidden directory name is detected from the path string."""
+        with patch.dict(os.environ, {"OUT_OF_CONTEXT_STORAGE_PATH": storage_path}):
+            load_config()
+
+        assert ("old hidden directory path" in caplog.text) is warns
+
+    def test_load_config_is_cached(self) -> None:
+        """Test repeated calls reuse the loaded config until the cache is cleared."""
+        original_log_level = os.environ.get("OUT_OF_CONTEXT_LOG_LEVEL")
+
+        try:
+            os.environ["OUT_OF_CONTEXT_LOG_LEVEL"] = "DEBUG"
+            config = load_config()
+            os.environ["OUT_OF_CONTEXT_LOG_LEVEL"] = "WARNING"
+            assert load_config() is config
+            assert load_config().log_level == "DEBUG"
+
+            load_config.cache_clear()
+            assert load_config().log_level == "WARNING"
+        finally:
+            if original_log_level:
+                os.environ["OUT_OF_CONTEXT_LOG_LEVEL"] = original_log_level
+            elif "OUT_OF_CONTEXT_LOG_LEVEL" in os.environ:
+                del os.environ["OUT_OF_CONTEXT_LOG_LEVEL"]
+
     def test_load_config_file_error_handling(self, tmp_path) -> None:
         """Test that invalid config file is handled gracefully."""
 
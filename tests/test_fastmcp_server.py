@@ -105,6 +105,28 @@ class TestAppStateMiddleware:
         with pytest.raises(RuntimeError, match="FastMCP context not available"):
             await middleware.on_call_tool(mock_context, mock_call_next)
 
+    @pytest.mark.asyncio
+    async def test_middleware_uses_explicit_app_state(self, tmp_path) -> None:
+        """Test middleware injects the AppState it was constructed with."""
+        app_state = AppState(config={"storage_path": str(tmp_path)})
+        middleware = AppStateMiddleware(app_state)
+        mock_context = MagicMock()
+        mock_context.fastmcp_context = MagicMock()
+        mock_call_next = AsyncMock(return_value="result")
+
+        await middleware.on_call_tool(mock_context, mock_call_next)
+
+        mock_context.fastmcp_context.set_state.assert_called_once_with("app_state", app_state)
+
+    def test_initialize_app_state_binds_registered_middleware(self, tmp_path) -> None:
+        """Test initialize_app_state rebinds the middleware registered at import."""
+        from hjeon139_mcp_outofcontext import fastmcp_server
+
+        config = Config(storage_path=str(tmp_path / "test_storage"), log_level="INFO")
+        initialize_app_state(config)
+
+        assert fastmcp_server._app_state_middleware.app_state is get_app_state()
+
     @pytest.mark.asyncio
     async def test_middleware_injects_app_state_on_read_resource(self, tmp_path) -> None:
         """Test middleware injects AppState on resource read."""
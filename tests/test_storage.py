@@ -1,6 +1,7 @@
 """Tests for MDC storage layer."""
 
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -117,6 +118,20 @@ class TestMDCStorage:
         # Newest should be first
         assert contexts[0]["name"] == "new"
 
+    def test_list_contexts_with_limit(self, mdc_storage: MDCStorage) -> None:
+        """Test that limit returns the newest contexts in sorted order."""
+        for day in (3, 1, 4, 2, 5):
+            mdc_storage.save_context(
+                f"day-{day}", "Content", {"created_at": f"2024-01-0{day}T00:00:00"}
+            )
+
+        contexts = mdc_storage.list_contexts(limit=2)
+        assert [ctx["name"] for ctx in contexts] == ["day-5", "day-4"]
+
+        # Non-positive or oversized limits return everything
+        assert len(mdc_storage.list_contexts(limit=0)) == 5
+        assert len(mdc_storage.list_contexts(limit=10)) == 5
+
     def test_list_contexts_with_datetime_created_at(self, mdc_storage: MDCStorage) -> None:
         """Test that list_contexts handles datetime objects in created_at (YAML parsing edge case)."""
         from datetime import datetime
@@ -176,6 +191,18 @@ class TestMDCStorage:
         with pytest.raises(ValueError, match="not found"):
             mdc_storage.delete_context("nonexistent")
 
+    def test_delete_context_drops_cached_parse(self, mdc_storage: MDCStorage) -> None:
+        """Test that deleting a context evicts its cached parse."""
+        mdc_storage.save_context("doomed", "Content")
+        assert mdc_storage.load_context("doomed") is not None
+        file_path = mdc_storage.storage_path / "doomed.mdc"
+        assert file_path in mdc_storage._parsed_cache
+
+        mdc_storage.delete_context("doomed")
+
+        assert file_path not in mdc_storage._parsed_cache
+        assert mdc_storage.load_context("doomed") is None
+
     def test_delete_contexts_bulk(self, mdc_storage: MDCStorage) -> None:
         """Test bulk delete operation."""
         # Save some contexts
@@ -214,6 +241,16 @@ class TestMDCStorage:
         results = mdc_storage.search_contexts("code")
         assert len(results) == 2
 
+    def test_search_contexts_with_limit(self, mdc_storage: MDCStorage) -> None:
+        """Test that search stops once limit matches are found."""
+        for i in range(5):
+            mdc_storage.save_context(f"match-{i}", "Shared keyword")
+        mdc_storage.save_context("other", "Unrelated")
+
+        assert len(mdc_storage.search_contexts("keyword", limit=2)) == 2
+        assert len(mdc_storage.search_contexts("keyword", limit=0)) == 5
+        assert len(mdc_storage.search_contexts("keyword", limit=10)) == 5
+
     def test_search_contexts_empty_query(self, mdc_storage: MDCStorage) -> None:
         """Test that empty query returns empty list."""
         mdc_storage.save_context("test", "Content")
@@ -233,6 +270,9 @@ class TestMDCStorage:
         with pytest.raises(ValueError, match="must contain only"):
             mdc_storage.save_context("test@context", "Content")
 
+        with pytest.raises(ValueError, match="must contain only"):
+            mdc_storage.save_context("trailing-newline\n", "Content")
+
     def test_markdown_format_preserved(self, mdc_storage: MDCStorage) -> None:
         """Test that markdown formatting is preserved."""
         name = "markdown-test"
@@ -328,6 +368,111 @@ def hello():
         assert result["metadata"]["type"] == "test"
         assert result["metadata"]["custom"] == "value"
 
+    def test_parsed_file_cache_reused_until_file_changes(
+        self, mdc_storage: MDCStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that unchanged files are parsed once across load/list/search."""
+        mdc_storage.save_context("cached", "Cached content", {"type": "note"})
+
+        reads: list[Path] = []
+        original_read = mdc_storage._read_mdc_file
+
+        def counting_read(file_path: Path) -> dict[str, Any] | None:
+            reads.append(file_path)
+            return original_read(file_path)
+
+        monkeypatch.setattr(mdc_storage, "_read_mdc_file", counting_read)
+
+        assert mdc_storage.load_context("cached") is not None
+        assert len(mdc_storage.list_contexts()) == 1
+        assert len(mdc_storage.search_contexts("cached")) == 1
+        assert len(reads) == 1
+
+        # Saving through storage invalidates the cached parse
+        mdc_storage.save_context("cached", "Updated content")
+        result = mdc_storage.load_context("cached")
+        assert result is not None
+        assert result["text"] == "Updated content"
+        assert len(reads) == 2
+
+    def test_parsed_file_cache_detects_external_edit(self, mdc_storage: MDCStorage) -> None:
+        """Test that files edited outside storage are re-read."""
+        mdc_storage.save_context("external", "Original")
+        assert mdc_storage.load_context("external") is not None
+
+        file_path = mdc_storage.storage_path / "external.mdc"
+        file_path.write_text("---\nname: external\n---\n\nEdited elsewhere", encoding="utf-8")
+
+        result = mdc_storage.load_context("external")
+        assert result is not None
+        assert result["text"] == "Edited elsewhere"
+
+        file_path.unlink()
+        assert mdc_storage.load_context("external") is None
+
+    def test_parsed_file_cache_evicts_least_recently_used(self, temp_storage_path: Path) -> None:
+        """Test that the parse cache is bounded by cache_size."""
+        storage = MDCStorage(storage_path=str(temp_storage_path), cache_size=2)
+        for name in ("first", "second", "third"):
+            storage.save_context(name, f"{name} content")
+
+        storage.load_context("first")
+        storage.load_context("second")
+        storage.load_context("first")
+        storage.load_context("third")
+
+        cached_names = [path.stem for path in storage._parsed_cache]
+        assert cached_names == ["first", "third"]
+
+    def test_parsed_file_cache_disabled(self, temp_storage_path: Path) -> None:
+        """Test that cache_size=0 disables caching without changing results."""
+        storage = MDCStorage(storage_path=str(temp_storage_path), cache_size=0)
+        storage.save_context("uncached", "Content")
+
+        result = storage.load_context("uncached")
+        assert result is not None
+        assert result["text"] == "Content"
+        assert len(storage.search_contexts("content")) == 1
+        assert not storage._parsed_cache
+
+    def test_search_contexts_reflects_updated_content(self, mdc_storage: MDCStorage) -> None:
+        """Test that repeated searches see text and metadata changes."""
+        mdc_storage.save_context("searchable", "Alpha body", {"type": "Draft"})
+
+        assert mdc_storage.search_contexts("alpha")[0]["matches"] == ["text"]
+        assert mdc_storage.search_contexts("draft")[0]["matches"] == ["metadata"]
+
+        mdc_storage.save_context("searchable", "Beta body", {"type": "Final"})
+
+        assert mdc_storage.search_contexts("alpha") == []
+        assert mdc_storage.search_contexts("draft") == []
+        assert mdc_storage.search_contexts("beta")[0]["matches"] == ["text"]
+        assert mdc_storage.search_contexts("final")[0]["matches"] == ["metadata"]
+
+    def test_search_contexts_skips_non_mapping_frontmatter_consistently(
+        self, mdc_storage: MDCStorage
+    ) -> None:
+        """Test that a file with list frontmatter is skipped on every search."""
+        file_path = mdc_storage.storage_path / "odd.mdc"
+        file_path.write_text("---\n- a\n- b\n---\n\nOdd body", encoding="utf-8")
+
+        assert mdc_storage.search_contexts("odd") == []
+        assert mdc_storage.search_contexts("odd") == []
+
+    def test_loaded_metadata_mutation_does_not_leak(self, mdc_storage: MDCStorage) -> None:
+        """Test that mutating returned metadata does not affect later loads."""
+        mdc_storage.save_context("isolated", "Content", {"tags": ["a"]})
+
+        first = mdc_storage.load_context("isolated")
+        assert first is not None
+        first["metadata"]["tags"].append("b")
+        first["metadata"]["extra"] = True
+
+        second = mdc_storage.load_context("isolated")
+        assert second is not None
+        assert second["metadata"]["tags"] == ["a"]
+        assert "extra" not in second["metadata"]
+
     def test_storage_path_appends_contexts(self, tmp_path: Path) -> None:
         """Test that storage_path correctly appends /contexts subdirectory."""
         # Test the bug fix where storage_path from config needs /contexts appended